@@ -3,99 +3,249 @@
 For more information visit https://github.com/pi-apps/pi-python
 """
 
-import requests
+# stellar_sdk, requests, httpx and aiohttp are imported where they are first used, so
+# importing this module stays cheap for callers that only need part of it.
 import json
-import stellar_sdk as s_sdk
+import time
+import decimal
+import contextlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+STROOPS_PER_PI = 10000000
+STREAM_CHUNK_SIZE = 65536
+HTTP_TIMEOUT = 10
+HTTP_POOL_SIZE = 10
+ASYNC_HTTP_POOL_SIZE = 20
+HTTP_RETRIES = 3
+RETRY_BACKOFF = 0.2
+RETRY_STATUSES = (502, 503, 504)
+# Amounts are int64 stroops (up to 922337203685.4775807 Pi, 19 digits), so prec=19 scales them exactly
+# while staying narrower than the default context; with no traps a malformed amount becomes NaN instead of raising
+BALANCE_CONTEXT = decimal.Context(prec=19, rounding=decimal.ROUND_HALF_EVEN, traps=[])
+REQUIRED_PAYMENT_FIELDS = frozenset(("amount", "memo", "metadata", "user_uid", "identifier", "to_address"))
+# create_payment input; identifier, to_address etc. are assigned by the Pi server
+CREATE_PAYMENT_FIELDS = frozenset(("amount", "memo", "metadata", "uid"))
 
 class PiNetwork:
-     
+
+    PI_API_URL = "https://api.minepi.com"
+    MAINNET_HORIZON_URL = "https://api.mainnet.minepi.com"
+    TESTNET_HORIZON_URL = "https://api.testnet.minepi.com"
+    HORIZON_URLS = {"Pi Network": MAINNET_HORIZON_URL}
+    MAX_OPEN_PAYMENTS = 1000
+    BATCH_WORKERS = 10
+
     api_key = ""
     client = ""
     account = ""
     base_url = ""
     from_address = ""
-    open_payments = {}
+    open_payments = OrderedDict()
     network = ""
     server = ""
     keypair = ""
     fee = ""
+    fee_stroops = 0
+    session = None
+    use_httpx = False
+    http_errors = ()
+
+    def __init__(self, balance_ttl=2, precheck_balance=True):
+        # Seconds a fetched balance is reused, so create_payment and submit_payment share one Horizon call
+        self.balance_ttl = balance_ttl
+        self.balance_cache = None
+        # Horizon rejects underfunded transactions anyway; disable to save the balance lookup per payment
+        self.precheck_balance = precheck_balance
 
     def initialize(self, api_key, wallet_private_key, network):
         try:
             if not self.validate_private_seed_format(wallet_private_key):
                 print("No valid private seed!")
+                return False
             self.api_key = api_key
+            self.session = self.create_http_session()
+            self.session.headers.update(self.get_http_headers())
             self.load_account(wallet_private_key, network)
-            self.base_url = "https://api.minepi.com"
-            self.open_payments = {}        
+            self.base_url = self.PI_API_URL
+            self.open_payments = OrderedDict()
             self.network = network
             self.fee = self.server.fetch_base_fee()
+            self.fee_stroops = int(self.fee)
             #self.fee = fee
         except:
             return False
 
+    def create_http_session(self):
+        # One pooled session for all Pi API calls, so keep-alive saves a TCP+TLS handshake per request.
+        # HTTP/2 (httpx[http2]) multiplexes back-to-back calls on a single connection when installed.
+        try:
+            import httpx
+        except ImportError:
+            httpx = None
+
+        if httpx is not None:
+            try:
+                transport = httpx.HTTPTransport(
+                    http2=True,
+                    retries=HTTP_RETRIES,
+                    limits=httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE),
+                )
+                session = httpx.Client(transport=transport, timeout=httpx.Timeout(HTTP_TIMEOUT))
+                self.use_httpx = True
+                self.http_errors = (httpx.HTTPError,)
+                return session
+            except ImportError:
+                pass
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self.use_httpx = False
+        self.http_errors = (requests.RequestException,)
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=HTTP_RETRIES,
+                backoff_factor=RETRY_BACKOFF,
+                status_forcelist=RETRY_STATUSES,
+                raise_on_status=False,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self):
+        if self.session:
+            self.session.close()
+            self.session = None
+
+    def http_get(self, url, stream=False):
+        # requests retries 502/503/504 in its HTTPAdapter; httpx only retries connects, so GETs retry here
+        attempt = 0
+        while True:
+            if self.use_httpx:
+                request = self.session.build_request("GET", url, timeout=HTTP_TIMEOUT)
+                re = self.session.send(request, stream=stream)
+            else:
+                re = self.session.get(url, stream=stream, timeout=HTTP_TIMEOUT)
+            if not self.use_httpx or re.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                return re
+            re.close()
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
+
     def get_balance(self):
+        return self.get_balance_stroops() / STROOPS_PER_PI
+
+    def get_balance_stroops(self):
+        balance = self.get_cached_balance()
+        if balance is not None:
+            return balance
         try:
-            balances = self.server.accounts().account_id(self.keypair.public_key).call()["balances"]
-            balance_found = False
-            for i in balances:
-                if i["asset_type"] == "native":
-                    return float(i["balance"])
-                
-            return 0
+            return self.cache_account_balance(self.server.accounts().account_id(self.keypair.public_key).call())
         except:
             return 0
 
+    def cache_account_balance(self, account_data):
+        for i in account_data["balances"]:
+            if i["asset_type"] == "native":
+                return self.cache_balance(self.to_stroops(i["balance"]))
+
+        return 0
+
+    def has_sufficient_balance(self, amount):
+        amount_stroops = self.to_stroops(amount)
+        if amount_stroops is None:
+            return False
+        return amount_stroops + self.fee_stroops <= self.get_balance_stroops()
+
+    def to_stroops(self, amount):
+        # Stellar amounts are fixed-point with 7 decimals, so the funds check can be plain int math
+        scaled = BALANCE_CONTEXT.multiply(BALANCE_CONTEXT.create_decimal(str(amount)), STROOPS_PER_PI)
+        if not scaled.is_finite():
+            return None
+        return int(scaled.to_integral_value(context=BALANCE_CONTEXT))
+
+    def get_cached_balance(self):
+        if self.balance_cache is None:
+            return None
+        fetched_at, balance = self.balance_cache
+        if time.monotonic() - fetched_at >= self.balance_ttl:
+            return None
+        return balance
+
+    def cache_balance(self, balance):
+        self.balance_cache = (time.monotonic(), balance)
+        return balance
+
     def get_payment(self, payment_id):
         url = self.base_url + "/v2/payments/" + payment_id
-        re = requests.get(url,headers=self.get_http_headers())
-        self.handle_http_response(re)
+        re = self.http_get(url)
+        return self.handle_http_response(re)
 
     def create_payment(self, payment_data):
-        try:
+        if not self.validate_create_payment_data(payment_data):
+            print("No valid payment data!")
+            return ""
 
-            if not self.validate_payment_data(payment_data):
-                if __debug__:
-                    print("No valid payments found. Creating a new one...")
-
-            balances = self.server.accounts().account_id(self.keypair.public_key).call()["balances"]
-            balance_found = False
-            for i in balances:
-                if i["asset_type"] == "native":
-                    balance_found = True
-                    if (float(payment_data["amount"]) + (float(self.fee) / 10000000)) > float(i["balance"]):
-                        return ""
-                    break
-
-            if balance_found == False:
-                return ""
-
-            obj = {
-                'payment': payment_data,
-            }
-
-            obj = json.dumps(obj)
-            url = self.base_url + "/v2/payments"
-            res = requests.post(url, data=obj, json=obj, headers=self.get_http_headers())
-            parsed_response = self.handle_http_response(res)
-
-            identifier = ""
-            identifier_data = {}
-
-            if 'error' in parsed_response:
-                identifier = parsed_response['payment']["identifier"]
-                identifier_data = parsed_response['payment']
-            else:
-                identifier = parsed_response["identifier"]
-                identifier_data = parsed_response
+        if self.precheck_balance and not self.has_sufficient_balance(payment_data["amount"]):
+            return ""
+
+        obj = {
+            'payment': payment_data,
+        }
 
-            self.open_payments[identifier] = identifier_data
+        url = self.base_url + "/v2/payments"
+        try:
+            res = self.session.post(url, json=obj, timeout=HTTP_TIMEOUT)
+        except (TypeError, ValueError) + self.http_errors:
+            # TypeError/ValueError: payment_data is not JSON serializable
+            return ""
 
-            return identifier
-        except:
+        payment = self.created_payment(self.handle_http_response(res))
+        if not payment:
             return ""
 
+        identifier = payment["identifier"]
+        self.track_open_payment(identifier, payment)
+
+        return identifier
+
+    def created_payment(self, parsed_response):
+        # An ongoing payment is reported as an error that still carries that payment
+        if not parsed_response:
+            return None
+        if 'error' in parsed_response:
+            parsed_response = parsed_response.get('payment')
+        if not parsed_response or "identifier" not in parsed_response:
+            return None
+        return parsed_response
+
+    def track_open_payment(self, identifier, payment):
+        # Bounded so payments that are created but never submitted can't grow memory without limit
+        self.open_payments[identifier] = payment
+        self.open_payments.move_to_end(identifier)
+        if len(self.open_payments) > self.MAX_OPEN_PAYMENTS:
+            self.open_payments.popitem(last=False)
+
     def submit_payment(self, payment_id, pending_payment):
+        import stellar_sdk as s_sdk
+
         if payment_id not in self.open_payments:
             return False
         if pending_payment == False or payment_id in self.open_payments:
@@ -103,16 +253,7 @@ class PiNetwork:
         else:
             payment = pending_payment
         
-        balances = self.server.accounts().account_id(self.keypair.public_key).call()["balances"]
-        balance_found = False
-        for i in balances:
-            if i["asset_type"] == "native":
-                balance_found = True
-                if (float(payment["amount"]) + (float(self.fee)/10000000)) > float(i["balance"]):
-                    return ""
-                break
-                
-        if balance_found == False:
+        if self.precheck_balance and not self.has_sufficient_balance(payment["amount"]):
             return ""
         
         if __debug__:
@@ -128,7 +269,14 @@ class PiNetwork:
         }
 
         transaction = self.build_a2u_transaction(payment)
-        txid = self.submit_transaction(transaction)
+        try:
+            txid = self.submit_transaction(transaction)
+        except s_sdk.exceptions.BadRequestError as error:
+            # build() already advances the cached sequence; only resync from Horizon if it drifted
+            if not self.is_bad_sequence(error):
+                raise
+            self.set_account(self.server.load_account(self.keypair.public_key))
+            txid = self.submit_transaction(self.build_a2u_transaction(payment))
         if payment_id in self.open_payments:
             del self.open_payments[payment_id]
 
@@ -140,36 +288,76 @@ class PiNetwork:
             obj = {}
         else:
             obj = {"txid": txid}
-        
-        obj = json.dumps(obj)
+
         url = self.base_url + "/v2/payments/" + identifier + "/complete"
-        re = requests.post(url,data=obj,json=obj,headers=self.get_http_headers())
-        self.handle_http_response(re)
+        re = self.session.post(url, json=obj, timeout=HTTP_TIMEOUT)
+        return self.handle_http_response(re)
 
     def cancel_payment(self, identifier):
-        obj = {}
-        obj = json.dumps(obj)
         url = self.base_url + "/v2/payments/" + identifier + "/cancel"
-        re = requests.post(url,data=obj,json=obj,headers=self.get_http_headers())
-        self.handle_http_response(re)
+        re = self.session.post(url, json={}, timeout=HTTP_TIMEOUT)
+        return self.handle_http_response(re)
+
+    def complete_payments(self, payments):
+        # payments: iterable of (identifier, txid); calls overlap on the pooled session
+        with ThreadPoolExecutor(max_workers=self.BATCH_WORKERS) as executor:
+            futures = [executor.submit(self.complete_payment, identifier, txid) for identifier, txid in payments]
+        return [self.batch_outcome(future) for future in futures]
+
+    def cancel_payments(self, identifiers):
+        with ThreadPoolExecutor(max_workers=self.BATCH_WORKERS) as executor:
+            futures = [executor.submit(self.cancel_payment, identifier) for identifier in identifiers]
+        return [self.batch_outcome(future) for future in futures]
+
+    def batch_outcome(self, future):
+        # Each call's own result or exception, so one failure doesn't hide what the others already did
+        error = future.exception()
+        return future.result() if error is None else error
 
     def get_incomplete_server_payments(self):
         url = self.base_url + "/v2/payments/incomplete_server_payments"
-        re = requests.get(url,headers=self.get_http_headers())
+        re = self.http_get(url)
         res = self.handle_http_response(re)
         if not res:
             res = {"incomplete_server_payments": []}
-        return res["incomplete_server_payments"]
+        return res.get("incomplete_server_payments", [])
+
+    def iter_incomplete_server_payments(self):
+        # Streams the payments out of the response with ijson instead of decoding the whole body first
+        if ijson is None:
+            yield from self.get_incomplete_server_payments()
+            return
+
+        url = self.base_url + "/v2/payments/incomplete_server_payments"
+        with contextlib.closing(self.http_get(url, stream=True)) as re:
+            if self.use_httpx:
+                chunks = re.iter_bytes(STREAM_CHUNK_SIZE)
+            else:
+                chunks = re.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            payments = ijson.sendable_list()
+            parser = ijson.items_coro(payments, "incomplete_server_payments.item", use_float=True)
+            yielded = False
+            try:
+                for chunk in chunks:
+                    parser.send(chunk)
+                    yielded = yielded or bool(payments)
+                    yield from payments
+                    del payments[:]
+                parser.close()
+            except ijson.JSONError:
+                # A body that isn't JSON at all reads as no payments, like get_incomplete_server_payments;
+                # once payments were yielded, a corrupt or truncated body must not look like a shorter list
+                if yielded:
+                    raise
+                return
+            yield from payments
 
     def get_http_headers(self):
         return {'Authorization': "Key " + self.api_key, "Content-Type": "application/json"}
 
     def handle_http_response(self, re):
         try:
-           
-            result = re.json()
-            
-            result_dict = json.loads(str(json.dumps(result)))
+            result_dict = json_loads(re.content)
             if __debug__:
                 print("HTTP-Response: " + str(re))
                 print("HTTP-Response Data: " + str(result_dict))
@@ -182,19 +370,31 @@ class PiNetwork:
         pass
 
     def load_account(self, private_seed, network):
+        import stellar_sdk as s_sdk
+
         self.keypair = s_sdk.Keypair.from_secret(private_seed)
-        if network == "Pi Network":
-            host = "api.mainnet.minepi.com"
-            horizon = "https://api.mainnet.minepi.com"
-        else:
-            host = "api.testnet.minepi.com"
-            horizon = "https://api.testnet.minepi.com"
-        
-        self.server = s_sdk.Server(horizon)
-        self.account = self.server.load_account(self.keypair.public_key)
+        client = s_sdk.RequestsClient(
+            pool_size=HTTP_POOL_SIZE,
+            num_retries=HTTP_RETRIES,
+            request_timeout=HTTP_TIMEOUT,
+            backoff_factor=RETRY_BACKOFF,
+        )
+        self.server = s_sdk.Server(self.get_horizon_url(network), client=client)
+        self.set_account(self.server.load_account(self.keypair.public_key))
+
+    def get_horizon_url(self, network):
+        return self.HORIZON_URLS.get(network, self.TESTNET_HORIZON_URL)
+
+    def set_account(self, account):
+        self.account = account
+        # Horizon has no sparse fieldsets, so reuse the balances already in the account payload
+        if getattr(account, "raw_data", None):
+            self.cache_account_balance(account.raw_data)
 
 
     def build_a2u_transaction(self, transaction_data):
+        import stellar_sdk as s_sdk
+
         if not self.validate_payment_data(transaction_data):
             print("No valid transaction!")
             
@@ -227,26 +427,252 @@ class PiNetwork:
         transaction.sign(self.keypair)
         response = self.server.submit_transaction(transaction)
         txid = response["id"]
+        self.balance_cache = None
         return txid
 
+    def is_bad_sequence(self, error):
+        result_codes = (error.extras or {}).get("result_codes", {})
+        return result_codes.get("transaction") == "tx_bad_seq"
+
     def validate_payment_data(self, data):
-        if "amount" not in data:
-            return False
-        elif "memo" not in data:
-            return False
-        elif "metadata" not in data:
-            return False
-        elif "user_uid" not in data:
-            return False
-        elif "identifier" not in data:
+        return REQUIRED_PAYMENT_FIELDS.issubset(data)
+
+    def validate_create_payment_data(self, data):
+        return isinstance(data, dict) and CREATE_PAYMENT_FIELDS.issubset(data)
+
+    def validate_private_seed_format(self, seed):
+        import stellar_sdk as s_sdk
+
+        return s_sdk.StrKey.is_valid_ed25519_secret_seed(seed)
+
+
+class AsyncPiNetwork(PiNetwork):
+    """
+    asyncio variant of PiNetwork. Every I/O method is a coroutine, so batches of
+    payments can be driven concurrently with asyncio.gather() over one pooled session.
+    Requires aiohttp (pip install stellar_sdk[aiohttp]).
+    """
+
+    async def initialize(self, api_key, wallet_private_key, network):
+        try:
+            if not self.validate_private_seed_format(wallet_private_key):
+                print("No valid private seed!")
+                return False
+            self.api_key = api_key
+            self.session = self.create_http_session()
+            await self.load_account(wallet_private_key, network)
+            self.base_url = self.PI_API_URL
+            self.open_payments = OrderedDict()
+            self.network = network
+            self.fee = await self.server.fetch_base_fee()
+            self.fee_stroops = int(self.fee)
+        except:
+            # Don't leave the aiohttp sessions of a failed initialization open
+            await self.close()
             return False
-        elif "to_address" not in data:
+
+    def create_http_session(self):
+        import asyncio
+        import aiohttp
+
+        self.http_errors = (aiohttp.ClientError, asyncio.TimeoutError)
+        connector = aiohttp.TCPConnector(limit=ASYNC_HTTP_POOL_SIZE, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+        return aiohttp.ClientSession(headers=self.get_http_headers(), connector=connector, timeout=timeout)
+
+    async def close(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
+        if self.server:
+            await self.server.close()
+
+    async def http_get(self, url):
+        # Same bounded 502/503/504 retry as the sync transports; the last response is returned
+        import asyncio
+
+        attempt = 0
+        while True:
+            re = await self.session.get(url)
+            if re.status not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                return re
+            re.release()
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
+
+    async def get_balance(self):
+        return await self.get_balance_stroops() / STROOPS_PER_PI
+
+    async def get_balance_stroops(self):
+        balance = self.get_cached_balance()
+        if balance is not None:
+            return balance
+        try:
+            return self.cache_account_balance(await self.server.accounts().account_id(self.keypair.public_key).call())
+        except:
+            return 0
+
+    async def has_sufficient_balance(self, amount):
+        amount_stroops = self.to_stroops(amount)
+        if amount_stroops is None:
             return False
-        return True
+        return amount_stroops + self.fee_stroops <= await self.get_balance_stroops()
 
-    def validate_private_seed_format(self, seed):
-        if not seed.upper().startswith("S"):
+    async def get_payment(self, payment_id):
+        url = self.base_url + "/v2/payments/" + payment_id
+        async with await self.http_get(url) as re:
+            return await self.handle_http_response(re)
+
+    async def create_payment(self, payment_data):
+        if not self.validate_create_payment_data(payment_data):
+            print("No valid payment data!")
+            return ""
+
+        if self.precheck_balance and not await self.has_sufficient_balance(payment_data["amount"]):
+            return ""
+
+        obj = {
+            'payment': payment_data,
+        }
+
+        url = self.base_url + "/v2/payments"
+        try:
+            async with self.session.post(url, json=obj) as res:
+                parsed_response = await self.handle_http_response(res)
+        except (TypeError, ValueError) + self.http_errors:
+            # TypeError/ValueError: payment_data is not JSON serializable
+            return ""
+
+        payment = self.created_payment(parsed_response)
+        if not payment:
+            return ""
+
+        identifier = payment["identifier"]
+        self.track_open_payment(identifier, payment)
+
+        return identifier
+
+    async def submit_payment(self, payment_id, pending_payment):
+        import stellar_sdk as s_sdk
+
+        if payment_id not in self.open_payments:
             return False
-        elif len(seed) != 56:
+        if pending_payment == False or payment_id in self.open_payments:
+            payment = self.open_payments[payment_id]
+        else:
+            payment = pending_payment
+
+        if self.precheck_balance and not await self.has_sufficient_balance(payment["amount"]):
+            return ""
+
+        if __debug__:
+            print("Debug_Data: Payment information\n" + str(payment))
+
+        self.set_horizon_client(payment["network"])
+
+        transaction = self.build_a2u_transaction(payment)
+        try:
+            txid = await self.submit_transaction(transaction)
+        except s_sdk.exceptions.BadRequestError as error:
+            if not self.is_bad_sequence(error):
+                raise
+            self.set_account(await self.server.load_account(self.keypair.public_key))
+            txid = await self.submit_transaction(self.build_a2u_transaction(payment))
+        if payment_id in self.open_payments:
+            del self.open_payments[payment_id]
+
+        return txid
+
+    async def complete_payment(self, identifier, txid):
+        if not txid:
+            obj = {}
+        else:
+            obj = {"txid": txid}
+
+        url = self.base_url + "/v2/payments/" + identifier + "/complete"
+        async with self.session.post(url, json=obj) as re:
+            return await self.handle_http_response(re)
+
+    async def cancel_payment(self, identifier):
+        url = self.base_url + "/v2/payments/" + identifier + "/cancel"
+        async with self.session.post(url, json={}) as re:
+            return await self.handle_http_response(re)
+
+    async def complete_payments(self, payments):
+        import asyncio
+
+        return await asyncio.gather(
+            *[self.complete_payment(identifier, txid) for identifier, txid in payments],
+            return_exceptions=True,
+        )
+
+    async def cancel_payments(self, identifiers):
+        import asyncio
+
+        return await asyncio.gather(
+            *[self.cancel_payment(identifier) for identifier in identifiers],
+            return_exceptions=True,
+        )
+
+    async def get_incomplete_server_payments(self):
+        url = self.base_url + "/v2/payments/incomplete_server_payments"
+        async with await self.http_get(url) as re:
+            res = await self.handle_http_response(re)
+        if not res:
+            res = {"incomplete_server_payments": []}
+        return res.get("incomplete_server_payments", [])
+
+    async def iter_incomplete_server_payments(self):
+        if ijson is None:
+            for payment in await self.get_incomplete_server_payments():
+                yield payment
+            return
+
+        url = self.base_url + "/v2/payments/incomplete_server_payments"
+        async with await self.http_get(url) as re:
+            payments = ijson.sendable_list()
+            parser = ijson.items_coro(payments, "incomplete_server_payments.item", use_float=True)
+            yielded = False
+            try:
+                async for chunk in re.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    parser.send(chunk)
+                    yielded = yielded or bool(payments)
+                    for payment in payments:
+                        yield payment
+                    del payments[:]
+                parser.close()
+            except ijson.JSONError:
+                if yielded:
+                    raise
+                return
+            for payment in payments:
+                yield payment
+
+    async def handle_http_response(self, re):
+        try:
+            result_dict = json_loads(await re.read())
+            if __debug__:
+                print("HTTP-Response: " + str(re))
+                print("HTTP-Response Data: " + str(result_dict))
+            return result_dict
+        except:
             return False
-        return True
+
+    async def load_account(self, private_seed, network):
+        import stellar_sdk as s_sdk
+
+        self.keypair = s_sdk.Keypair.from_secret(private_seed)
+        client = s_sdk.AiohttpClient(
+            pool_size=ASYNC_HTTP_POOL_SIZE,
+            request_timeout=HTTP_TIMEOUT,
+            backoff_factor=RETRY_BACKOFF,
+        )
+        self.server = s_sdk.ServerAsync(self.get_horizon_url(network), client=client)
+        self.set_account(await self.server.load_account(self.keypair.public_key))
+
+    async def submit_transaction(self, transaction):
+        transaction.sign(self.keypair)
+        response = await self.server.submit_transaction(transaction)
+        txid = response["id"]
+        self.balance_cache = None
+        return txid